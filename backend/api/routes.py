@@ -1,23 +1,30 @@
 from fastapi import APIRouter, HTTPException
 from typing import List
 from models import AIRequest, AIResponse, AlgorithmInfo, ErrorResponse
+from core.game_engine import GameEngine, O_TO_MOVE, move_to_index
+from core.ai_algorithms import AIAlgorithms
 
 router = APIRouter()
 
+# Shared across requests. The handler is async and the search is synchronous,
+# so requests run one at a time on the event loop and never interleave inside
+# get_best_move, which resets the per-search statistics on every call.
+_ENGINE = GameEngine()
+_AI = AIAlgorithms()
+_AI.warm_up()
+
 @router.post("/move", response_model=AIResponse)
 async def get_ai_move(request: AIRequest):
     """
     Get AI move for the current game state using specified algorithm.
     """
     try:
-        from core.game_engine import GameEngine
-        from core.ai_algorithms import AIAlgorithms
-        
-        game_engine = GameEngine()
-        ai_algorithms = AIAlgorithms()
+        game_engine = _ENGINE
+        ai_algorithms = _AI
         
-        # Validate the game state
-        if not game_engine.is_valid_board(request.board):
+        # Validate the game state and convert the board once (the AI moves next as O)
+        bb = game_engine.parse_board_bb(request.board, O_TO_MOVE)
+        if bb is None:
             raise HTTPException(
                 status_code=400,
                 detail=ErrorResponse.create(
@@ -27,11 +34,8 @@ async def get_ai_move(request: AIRequest):
             )
         
         # Check if game is already over
-        if game_engine.is_game_over(request.board):
-            winner = game_engine.check_winner(request.board)
-            if winner is None and game_engine.is_draw(request.board):
-                winner = "draw"
-            
+        winner = game_engine.terminal_status_bb(bb)
+        if winner is not None:
             raise HTTPException(
                 status_code=400,
                 detail=ErrorResponse.create(
@@ -42,8 +46,8 @@ async def get_ai_move(request: AIRequest):
         
         # Get AI move using specified algorithm
         try:
-            best_move, analysis = ai_algorithms.get_best_move(
-                board=request.board,
+            best_move, analysis = ai_algorithms._get_best_move_bb(
+                bb=bb,
                 algorithm=request.algorithm.value,
                 difficulty=request.difficulty.value,
                 max_depth=request.max_depth
@@ -58,23 +62,19 @@ async def get_ai_move(request: AIRequest):
             )
         
         # Make the AI move to check game state after move
-        new_board = game_engine.make_move(request.board, best_move, "O")
-        game_over = game_engine.is_game_over(new_board)
-        winner = None
+        new_bb = game_engine.make_move_bb(bb, move_to_index(best_move))
+        winner = game_engine.terminal_status_bb(new_bb)
+        game_over = winner is not None
         
-        if game_over:
-            winner = game_engine.check_winner(new_board)
-            if winner is None and game_engine.is_draw(new_board):
-                winner = "draw"
-        
-        return AIResponse(
+        # Every field comes from the engine and AI, so skip re-validating the response
+        return AIResponse.model_construct(
             move=best_move,
             evaluation=analysis.evaluation_score,
             analysis=analysis,
             game_over=game_over,
             winner=winner
         )
-        
+    
     except HTTPException:
         raise
     except Exception as e:
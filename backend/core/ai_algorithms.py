@@ -2,7 +2,244 @@ import time
 import random
 from typing import Tuple, Optional, Dict, Any
 from models import Move, GameState, AlgorithmAnalysis
-from core.game_engine import GameEngine
+from core.game_engine import (
+    GameEngine, Board, O_TO_MOVE, X_TO_MOVE, SYMMETRIES, SYMMETRY_INVERSES,
+    SYMMETRY_TABLES, canonical, index_to_move, popcount, to_bitboard
+)
+from core import search_kernel
+from core.constants import CENTER, CORNERS, EDGES, FULL_BOARD
+from core.search_kernel import (
+    DRAW_SCORE, INFINITY, LOSE_SCORE, STAT_MAX_DEPTH, STAT_NODES, STAT_PRUNED,
+    STAT_WRITTEN, STATS_SIZE, WIN_SCORE, WIN_TABLE
+)
+
+
+def _solve_position(x_bits: int, o_bits: int, to_move: int, table: Dict[int, Tuple[int, int]]) -> int:
+    """
+    Solve a position to the end of the game with negamax, filling the table.
+    
+    Scores are from the point of view of the side to move and count plies
+    from this position: WIN_SCORE - n for a win on the n-th ply, LOSE_SCORE + n
+    for a loss. This matches a full-depth search started at the position.
+    """
+    key, symmetry = canonical((x_bits, o_bits, to_move))
+    entry = table.get(key)
+    if entry is not None:
+        return entry[1]
+    
+    own_bits = o_bits if to_move == O_TO_MOVE else x_bits
+    occupied = x_bits | o_bits
+    best_index = -1
+    best_score = -INFINITY
+    
+    for index in range(9):
+        bit = 1 << index
+        if occupied & bit:
+            continue
+        
+        if WIN_TABLE[own_bits | bit]:
+            score = WIN_SCORE - 1
+        elif (occupied | bit) == FULL_BOARD:
+            score = DRAW_SCORE
+        else:
+            if to_move == O_TO_MOVE:
+                score = -_solve_position(x_bits, o_bits | bit, X_TO_MOVE, table)
+            else:
+                score = -_solve_position(x_bits | bit, o_bits, O_TO_MOVE, table)
+            # The opponent's result is one ply further away from this position
+            if score > 0:
+                score -= 1
+            elif score < 0:
+                score += 1
+        
+        if score > best_score:
+            best_score = score
+            best_index = index
+    
+    table[key] = (SYMMETRIES[symmetry][best_index], best_score)
+    return best_score
+
+
+def _build_perfect_play_table() -> Dict[int, Tuple[int, int]]:
+    """
+    Solve the whole game once, with either player moving first.
+    
+    Maps every reachable non-terminal position, in every orientation and packed
+    into an int like canonical's key (to_move << 18 | x_bits << 9 | o_bits), to
+    its best move (cell index) and score. The game is solved on positions
+    reduced by symmetry, then each one is stored under all 8 orientations, so
+    a lookup is a single dict probe with no canonical() call.
+    """
+    solved = {}
+    _solve_position(0, 0, X_TO_MOVE, solved)
+    _solve_position(0, 0, O_TO_MOVE, solved)
+    
+    table = {}
+    for key in solved:
+        to_move = key >> 18
+        x_bits = key >> 9 & FULL_BOARD
+        o_bits = key & FULL_BOARD
+        for symmetry_table in SYMMETRY_TABLES:
+            variant = (symmetry_table[x_bits], symmetry_table[o_bits], to_move)
+            variant_key = to_move << 18 | variant[0] << 9 | variant[1]
+            if variant_key in table:
+                continue
+            # Map the move the same way a canonical lookup of this variant would
+            canonical_key, symmetry = canonical(variant)
+            best_move, score = solved[canonical_key]
+            table[variant_key] = (SYMMETRY_INVERSES[symmetry][best_move], score)
+    return table
+
+
+# The alpha-beta search runs in the interpreter, so it calls the heuristic uncompiled
+_position_value = search_kernel.python_function(search_kernel.position_value_bits)
+
+# Transposition table entry flags: the stored value is exact, a lower bound or an upper bound
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Static alpha-beta move order: center, then corners, then edges
+MOVE_ORDER = (CENTER,) + CORNERS + EDGES
+
+
+def _ordered_moves(own_bits: int, opponent_bits: int, hint: Optional[int]) -> list:
+    """
+    List the moves of a position for alpha-beta, likely best moves first:
+    the hint (the stored best move), then winning moves, then blocking
+    moves, each group in MOVE_ORDER.
+    """
+    occupied = own_bits | opponent_bits
+    
+    wins = []
+    blocks = []
+    others = []
+    for move in MOVE_ORDER:
+        bit = 1 << move
+        if occupied & bit or move == hint:
+            continue
+        if WIN_TABLE[own_bits | bit]:
+            wins.append(move)
+        elif WIN_TABLE[opponent_bits | bit]:
+            blocks.append(move)
+        else:
+            others.append(move)
+    
+    moves = [hint] if hint is not None else []
+    return moves + wins + blocks + others
+
+
+def _unique_moves(x_bits: int, o_bits: int, to_move: int, moves: list) -> list:
+    """Keep one move out of each group of moves that lead to symmetric positions."""
+    seen = set()
+    unique = []
+    for move in moves:
+        bit = 1 << move
+        if to_move == O_TO_MOVE:
+            child_key, _ = canonical((x_bits, o_bits | bit, X_TO_MOVE))
+        else:
+            child_key, _ = canonical((x_bits | bit, o_bits, O_TO_MOVE))
+        if child_key not in seen:
+            seen.add(child_key)
+            unique.append(move)
+    return unique
+
+
+def _negamax(x_bits: int, o_bits: int, depth: int, alpha: int, beta: int, color: int,
+             max_depth: int, stats: list, tt: Dict[int, Tuple[int, int, int, Optional[int]]]) -> Tuple[Optional[int], int]:
+    """
+    Alpha-beta recursion behind AIAlgorithms.negamax (see there for the arguments).
+    
+    It is a plain function that only uses its arguments, locals and module
+    constants. tt is the transposition table:
+    packed canonical position -> (remaining depth, value, flag, best move),
+    with the best move stored as a cell index in the canonical orientation.
+    """
+    # Update search statistics
+    stats[STAT_NODES] += 1
+    if depth > stats[STAT_MAX_DEPTH]:
+        stats[STAT_MAX_DEPTH] = depth
+    
+    # Base case: game over or reached maximum search depth
+    if WIN_TABLE[x_bits]:
+        return None, color * (LOSE_SCORE + depth)  # The human (X) won
+    if WIN_TABLE[o_bits]:
+        return None, color * (WIN_SCORE - depth)  # The AI (O) won
+    if (x_bits | o_bits) == FULL_BOARD:
+        return None, DRAW_SCORE
+    if depth >= max_depth:
+        return None, color * _position_value(x_bits, o_bits)
+    
+    # Transposition table: reuse a result for this position if it was searched deep enough
+    remaining = max_depth - depth
+    alpha_orig = alpha
+    to_move = O_TO_MOVE if color == 1 else X_TO_MOVE
+    key, symmetry = canonical((x_bits, o_bits, to_move))
+    entry = tt.get(key)
+    hint = None
+    if entry is not None:
+        # Map the stored move from the canonical orientation back onto this position
+        hint = SYMMETRY_INVERSES[symmetry][entry[3]]
+        if entry[0] >= remaining:
+            _, value, flag, _ = entry
+            if flag == EXACT:
+                return hint, value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return hint, value
+    
+    # Get all possible moves, most promising first (try the stored best move before the rest)
+    own_bits, opponent_bits = (o_bits, x_bits) if color == 1 else (x_bits, o_bits)
+    available_moves = _ordered_moves(own_bits, opponent_bits, hint)
+    if depth == 0:
+        available_moves = _unique_moves(x_bits, o_bits, to_move, available_moves)
+    
+    best_score = -INFINITY
+    best_move = None
+    to_canonical = SYMMETRIES[symmetry]
+    
+    for move in available_moves:
+        bit = 1 << move
+        
+        # An immediate win can't be improved on: take it without searching below it
+        if WIN_TABLE[own_bits | bit]:
+            best_score = WIN_SCORE - (depth + 1)
+            tt[key] = (remaining, best_score, EXACT, to_canonical[move])
+            return move, best_score
+        
+        # See what happens if the opponent plays optimally after this move
+        if color == 1:
+            score = -_negamax(x_bits, o_bits | bit, depth + 1, -beta, -alpha, -color, max_depth, stats, tt)[1]
+        else:
+            score = -_negamax(x_bits | bit, o_bits, depth + 1, -beta, -alpha, -color, max_depth, stats, tt)[1]
+        
+        # Keep track of the best move so far
+        if score > best_score:
+            best_score = score
+            best_move = move
+        
+        # Update alpha (best score the side to move can guarantee)
+        alpha = max(alpha, score)
+        
+        # Pruning: the opponent will never allow this position, stop searching
+        if beta <= alpha:
+            stats[STAT_PRUNED] += 1
+            break
+    
+    # Record whether the score is exact or only a bound caused by a cutoff
+    if best_score <= alpha_orig:
+        flag = UPPER
+    elif best_score >= beta:
+        flag = LOWER
+    else:
+        flag = EXACT
+    tt[key] = (remaining, best_score, flag, to_canonical[best_move])
+    
+    return best_move, best_score
+
 
 class AIAlgorithms:
     """
@@ -12,17 +249,36 @@ class AIAlgorithms:
     1. Minimax - Classic game tree search
     2. Alpha-Beta Pruning - Optimized minimax with branch pruning
     3. Depth-Limited Search - Minimax with configurable depth limits
+    
+    The searches run on bitboard positions; the public methods convert the
+    list board once on entry. The AI always plays O.
     """
     
     # Constants for better readability
     AI_PLAYER = "O"
     HUMAN_PLAYER = "X"
-    WIN_SCORE = 100
-    LOSE_SCORE = -100
-    DRAW_SCORE = 0
+    WIN_SCORE = search_kernel.WIN_SCORE
+    LOSE_SCORE = search_kernel.LOSE_SCORE
+    DRAW_SCORE = search_kernel.DRAW_SCORE
+    # Integer search window bounds; scores stay ints throughout the search
+    INFINITY = search_kernel.INFINITY
+    
+    ALGORITHM_NAMES = {
+        "minimax": "Classic minimax",
+        "alpha_beta": "Alpha-beta pruning",
+        "depth_limited": "Depth-limited search"
+    }
+    
+    # Perfect-play table shared by all instances, built on first use
+    _perfect_play: Optional[Dict[int, Tuple[int, int]]] = None
     
     def __init__(self):
         self.game_engine = GameEngine()
+        self._rng = random.Random()  # Own generator for easy-mode moves, not the shared module one
+        
+        # Minimax transposition table, allocated once and emptied after each search
+        self._minimax_table = search_kernel.new_table()
+        self._minimax_written = search_kernel.new_written_keys()
         self._reset_stats()
     
     def _reset_stats(self):
@@ -31,16 +287,38 @@ class AIAlgorithms:
         self.pruned_branches = 0
         self.max_depth_reached = 0
         self.start_time = time.time()
+        
+        # Alpha-beta transposition table: packed canonical position -> (remaining depth, value, flag, best move),
+        # with the best move stored as a cell index in the canonical orientation.
+        # Scores depend on the distance from the search root, so entries only live for one search.
+        self.tt: Dict[int, Tuple[int, int, int, Optional[int]]] = {}
+    
+    def _new_search_stats(self) -> list:
+        """
+        Create the counters negamax updates while it searches, in the layout of
+        search_kernel.new_stats but as a plain list, since negamax runs in the
+        interpreter. Negamax writes no kernel table, so its written slot stays 0.
+        """
+        return [0] * STATS_SIZE
+    
+    def _record_search_stats(self, stats: list):
+        """Add the counters of a finished minimax or negamax search to the statistics."""
+        self.nodes_explored += int(stats[STAT_NODES])
+        self.pruned_branches += int(stats[STAT_PRUNED])
+        self.max_depth_reached = max(self.max_depth_reached, int(stats[STAT_MAX_DEPTH]))
     
     def _create_analysis(self, move_reasoning: str, evaluation_score: float) -> AlgorithmAnalysis:
-        """Create algorithm analysis with current statistics."""
-        return AlgorithmAnalysis(
+        """
+        Create algorithm analysis with current statistics.
+        The fields are built here with the right types, so Pydantic validation is skipped.
+        """
+        return AlgorithmAnalysis.model_construct(
             nodes_explored=self.nodes_explored,
             pruned_branches=self.pruned_branches,
             max_depth_reached=self.max_depth_reached,
             thinking_time=time.time() - self.start_time,
             move_reasoning=move_reasoning,
-            evaluation_score=evaluation_score
+            evaluation_score=float(evaluation_score)
         )
     
     def evaluate_position(self, board: list, depth: int = 0) -> float:
@@ -53,47 +331,20 @@ class AIAlgorithms:
             0: Draw or neutral position
             -10 to +10: Ongoing game with positional advantages
         """
-        winner = self.game_engine.check_winner(board)
-        
-        # Terminal positions (game over)
-        if winner == self.AI_PLAYER:
+        return self._evaluate_bb(to_bitboard(board), depth)
+    
+    def _evaluate_bb(self, bb: Board, depth: int) -> float:
+        """Evaluate a bitboard position (see evaluate_position)."""
+        status = self.game_engine.terminal_status_bb(bb)
+        if status == self.AI_PLAYER:
             return self.WIN_SCORE - depth  # Prefer quicker wins
-        elif winner == self.HUMAN_PLAYER:
+        if status == self.HUMAN_PLAYER:
             return self.LOSE_SCORE + depth  # Delay losses if unavoidable
-        elif self.game_engine.is_draw(board):
+        if status == "draw":
             return self.DRAW_SCORE
         
         # Non-terminal positions: use heuristic evaluation
-        return self._calculate_position_value(board)
-    
-    def _calculate_position_value(self, board: list) -> float:
-        """
-        Calculate positional value for non-terminal positions.
-        
-        Strategy:
-        - Center control is valuable (3 points)
-        - Corner control is good (2 points each)
-        - Edge positions are neutral
-        """
-        score = 0
-        
-        # Center square bonus (most valuable position)
-        center_player = board[1][1]
-        if center_player == self.AI_PLAYER:
-            score += 3
-        elif center_player == self.HUMAN_PLAYER:
-            score -= 3
-        
-        # Corner squares bonus
-        corner_positions = [(0, 0), (0, 2), (2, 0), (2, 2)]
-        for row, col in corner_positions:
-            corner_player = board[row][col]
-            if corner_player == self.AI_PLAYER:
-                score += 2
-            elif corner_player == self.HUMAN_PLAYER:
-                score -= 2
-        
-        return score
+        return _position_value(bb[0], bb[1])
     
     def minimax(self, board: list, depth: int, is_ai_turn: bool, max_depth: int = 9) -> Tuple[Optional[Move], float]:
         """
@@ -110,80 +361,53 @@ class AIAlgorithms:
             depth: How deep we are in the search tree
             is_ai_turn: True if it's AI's turn, False if human's turn
             max_depth: Maximum depth to search
-            
+        
         Returns:
             (best_move, score) - The best move and its evaluation score
         """
-        # Update search statistics
-        self.nodes_explored += 1
-        self.max_depth_reached = max(self.max_depth_reached, depth)
-        
-        # Base case: game over or reached maximum search depth
-        if self._should_stop_search(board, depth, max_depth):
-            return None, self.evaluate_position(board, depth)
+        bb = to_bitboard(board, O_TO_MOVE if is_ai_turn else X_TO_MOVE)
+        color = 1 if is_ai_turn else -1
+        index, score = self._minimax_bb(bb, depth, color, max_depth)
+        return (index_to_move(index) if index is not None else None), color * score
+    
+    def _minimax_bb(self, bb: Board, depth: int, color: int, max_depth: int) -> Tuple[Optional[int], float]:
+        """
+        Minimax in negamax form on a bitboard position.
+        
+        Scores are from the point of view of the side to move (color is +1 when
+        the AI moves, -1 for the human), so both players pick the move with the
+        highest negated score of the position after it. The recursion runs in
+        the integer search kernel, which is compiled when Numba is installed.
+        Positions reached again through a different move order are scored once,
+        from the search's transposition table. Returns the best move as a cell index.
+        """
+        stats = search_kernel.new_stats()
+        table = self._minimax_table
+        written = self._minimax_written
+        index, score = search_kernel.minimax_search(bb[0], bb[1], color, depth, max_depth, stats, table, written)
         
-        # Get all possible moves
-        available_moves = self.game_engine.get_available_moves(board)
+        # Empty the table for the next search, touching only the entries this one wrote
+        search_kernel.clear_table(table, written, int(stats[STAT_WRITTEN]))
+        self._record_search_stats(stats)
         
-        if is_ai_turn:
-            return self._maximize_score(board, depth, available_moves, max_depth)
-        else:
-            return self._minimize_score(board, depth, available_moves, max_depth)
-    
-    def _should_stop_search(self, board: list, depth: int, max_depth: int) -> bool:
-        """Check if we should stop searching (terminal node or max depth)."""
-        return self.game_engine.is_game_over(board) or depth >= max_depth
-    
-    def _maximize_score(self, board: list, depth: int, moves: list, max_depth: int) -> Tuple[Move, float]:
-        """AI's turn: find the move that maximizes the score."""
-        best_score = float('-inf')
-        best_move = None
-        
-        for move in moves:
-            # Try this move for AI
-            new_board = self.game_engine.make_move(board, move, self.AI_PLAYER)
-            
-            # See what happens if human plays optimally after this move
-            result = self.minimax(new_board, depth + 1, False, max_depth)
-            move_from_recursion = result[0]  # We don't need this
-            score = result[1]  # This is what we care about
-            
-            # Keep track of the best move so far
-            if score > best_score:
-                best_score = score
-                best_move = move
-        
-        return best_move, best_score
-    
-    def _minimize_score(self, board: list, depth: int, moves: list, max_depth: int) -> Tuple[Move, float]:
-        """Human's turn: find the move that minimizes the score (best for human)."""
-        best_score = float('inf')
-        best_move = None
-        
-        for move in moves:
-            # Try this move for human
-            new_board = self.game_engine.make_move(board, move, self.HUMAN_PLAYER)
-            
-            # See what happens if AI plays optimally after this move
-            result = self.minimax(new_board, depth + 1, True, max_depth)
-            move_from_recursion = result[0]  # We don't need this
-            score = result[1]  # This is what we care about
-            
-            # Keep track of the best move for human (lowest score)
-            if score < best_score:
-                best_score = score
-                best_move = move
-        
-        return best_move, best_score
-    
-    def alpha_beta(self, board: list, depth: int, alpha: float, beta: float, 
+        return (index if index >= 0 else None), score
+    
+    def warm_up(self):
+        """
+        Run a one-ply minimax search on the empty board so that Numba compiles
+        the search kernels now rather than inside the first real request.
+        """
+        self._minimax_bb((0, 0, O_TO_MOVE), 0, 1, 1)
+        self._reset_stats()
+    
+    def alpha_beta(self, board: list, depth: int, alpha: float, beta: float,
                    is_ai_turn: bool, max_depth: int = 9) -> Tuple[Optional[Move], float]:
         """
         Minimax with alpha-beta pruning - same as minimax but faster.
         
         How pruning works:
         - Alpha: best score AI can guarantee so far
-        - Beta: best score human can guarantee so far  
+        - Beta: best score human can guarantee so far
         - If alpha >= beta, we can stop searching (prune the branch)
         
         Args:
@@ -193,85 +417,42 @@ class AIAlgorithms:
             beta: Best score human can guarantee
             is_ai_turn: True if AI's turn, False if human's turn
             max_depth: Maximum search depth
-            
+        
         Returns:
             (best_move, score) - The best move and its evaluation score
         """
-        # Update search statistics
-        self.nodes_explored += 1
-        self.max_depth_reached = max(self.max_depth_reached, depth)
+        bb = to_bitboard(board, O_TO_MOVE if is_ai_turn else X_TO_MOVE)
+        color = 1 if is_ai_turn else -1
+        self.tt.clear()  # New search root
+        
+        # Negamax scores are from the mover's point of view: flip the window for the human
+        if not is_ai_turn:
+            alpha, beta = -beta, -alpha
+        # The search works on integer scores; an infinite bound is the same as INFINITY
+        alpha = max(alpha, -INFINITY)
+        beta = min(beta, INFINITY)
+        stats = self._new_search_stats()
+        index, score = self.negamax(bb[0], bb[1], depth, alpha, beta, color, max_depth, stats)
+        self._record_search_stats(stats)
+        return (index_to_move(index) if index is not None else None), color * score
+    
+    def negamax(self, x_bits: int, o_bits: int, depth: int, alpha: int, beta: int,
+                color: int, max_depth: int, stats: list) -> Tuple[Optional[int], int]:
+        """
+        Alpha-beta search in negamax form on a bitboard position.
         
-        # Base case: game over or reached maximum search depth
-        if self._should_stop_search(board, depth, max_depth):
-            return None, self.evaluate_position(board, depth)
+        The position is passed as its two masks, so children are made by setting
+        a bit instead of building a new position. color gives the side to move:
+        +1 for the AI (O), -1 for the human (X).
         
-        # Get all possible moves
-        available_moves = self.game_engine.get_available_moves(board)
+        Scores, alpha and beta are from the point of view of the side to move.
+        Each child is searched with the window flipped to (-beta, -alpha) and
+        its score negated. Moves are cell indices (row * 3 + col) throughout.
         
-        if is_ai_turn:
-            return self._maximize_with_pruning(board, depth, available_moves, alpha, beta, max_depth)
-        else:
-            return self._minimize_with_pruning(board, depth, available_moves, alpha, beta, max_depth)
-    
-    def _maximize_with_pruning(self, board: list, depth: int, moves: list, 
-                              alpha: float, beta: float, max_depth: int) -> Tuple[Move, float]:
-        """AI's turn with alpha-beta pruning."""
-        best_score = float('-inf')
-        best_move = None
-        
-        for move in moves:
-            # Try this move for AI
-            new_board = self.game_engine.make_move(board, move, self.AI_PLAYER)
-            
-            # See what happens if human plays optimally after this move
-            result = self.alpha_beta(new_board, depth + 1, alpha, beta, False, max_depth)
-            move_from_recursion = result[0]  # We don't need this
-            score = result[1]  # This is what we care about
-            
-            # Keep track of the best move so far
-            if score > best_score:
-                best_score = score
-                best_move = move
-            
-            # Update alpha (best score AI can guarantee)
-            alpha = max(alpha, score)
-            
-            # Pruning: if AI can guarantee better than what human allows, stop searching
-            if beta <= alpha:
-                self.pruned_branches += 1
-                break  # Beta cutoff - no need to check remaining moves
-        
-        return best_move, best_score
-    
-    def _minimize_with_pruning(self, board: list, depth: int, moves: list,
-                              alpha: float, beta: float, max_depth: int) -> Tuple[Move, float]:
-        """Human's turn with alpha-beta pruning."""
-        best_score = float('inf')
-        best_move = None
-        
-        for move in moves:
-            # Try this move for human
-            new_board = self.game_engine.make_move(board, move, self.HUMAN_PLAYER)
-            
-            # See what happens if AI plays optimally after this move
-            result = self.alpha_beta(new_board, depth + 1, alpha, beta, True, max_depth)
-            move_from_recursion = result[0]  # We don't need this
-            score = result[1]  # This is what we care about
-            
-            # Keep track of the best move for human (lowest score)
-            if score < best_score:
-                best_score = score
-                best_move = move
-            
-            # Update beta (best score human can guarantee)
-            beta = min(beta, score)
-            
-            # Pruning: if human can guarantee better than what AI allows, stop searching
-            if beta <= alpha:
-                self.pruned_branches += 1
-                break  # Alpha cutoff - no need to check remaining moves
-        
-        return best_move, best_score
+        The counters in stats (see _new_search_stats) are kept in a local list
+        and only added to the instance statistics by the caller.
+        """
+        return _negamax(x_bits, o_bits, depth, alpha, beta, color, max_depth, stats, self.tt)
     
     def depth_limited_minimax(self, board: list, max_depth: int) -> Tuple[Optional[Move], float]:
         """
@@ -285,13 +466,13 @@ class AIAlgorithms:
         Args:
             board: Current game board
             max_depth: How deep to search (1 = only look at immediate moves)
-            
+        
         Returns:
             (best_move, score) - The best move and its evaluation score
         """
         return self.minimax(board, 0, True, max_depth)
     
-    def get_best_move(self, board: list, algorithm: str = "minimax", 
+    def get_best_move(self, board: list, algorithm: str = "minimax",
                      difficulty: str = "medium", max_depth: Optional[int] = None) -> Tuple[Move, AlgorithmAnalysis]:
         """
         Get the best move using the specified algorithm and difficulty.
@@ -303,17 +484,26 @@ class AIAlgorithms:
             algorithm: Which algorithm to use ('minimax', 'alpha_beta', 'depth_limited')
             difficulty: How hard the AI should play ('easy', 'medium', 'hard')
             max_depth: Override search depth (if None, uses difficulty setting)
-            
+        
         Returns:
             (best_move, analysis) - The chosen move and detailed analysis
         """
+        # The AI is the side to move
+        return self._get_best_move_bb(to_bitboard(board, O_TO_MOVE), algorithm, difficulty, max_depth)
+    
+    def _get_best_move_bb(self, bb: Board, algorithm: str, difficulty: str,
+                          max_depth: Optional[int]) -> Tuple[Move, AlgorithmAnalysis]:
+        """
+        get_best_move on a bitboard position with O (the AI) to move, for callers
+        that have already converted the board.
+        """
         self._reset_stats()
         
         # Determine search depth based on difficulty
         search_depth = self._get_search_depth(difficulty, max_depth)
         
-        # Get all possible moves
-        available_moves = self.game_engine.get_available_moves(board)
+        # Get all possible moves (as cell indices until the final move is chosen)
+        available_moves = self.game_engine.get_available_move_indices_bb(bb)
         
         # Handle edge cases
         if not available_moves:
@@ -321,14 +511,32 @@ class AIAlgorithms:
         
         if len(available_moves) == 1:
             # Only one move possible - no need to search
-            move = available_moves[0]
+            move = index_to_move(available_moves[0])
             analysis = self._create_analysis("Only one move available", 0.0)
             return move, analysis
         
-        # Run the chosen algorithm
-        best_move, eval_score, move_reasoning = self._run_algorithm(
-            board, algorithm, search_depth
-        )
+        # The first move of each side comes from the opening book;
+        # a search that reaches the end of the game has a precomputed answer
+        opening_move = self._opening_book_move(bb)
+        solved = None
+        if opening_move is None and search_depth >= len(available_moves):
+            solved = self._lookup_perfect_play(bb)
+        
+        if opening_move is not None:
+            best_move = opening_move
+            eval_score = self.DRAW_SCORE  # Perfect play from here is a draw
+            move_reasoning = "Opening book move: center, or a corner if the center is taken"
+        elif solved is not None:
+            best_move, eval_score = solved
+            algorithm_name = self.ALGORITHM_NAMES.get(algorithm, self.ALGORITHM_NAMES["minimax"])
+            move_reasoning = f"{algorithm_name} result from the precomputed perfect-play table"
+            self.nodes_explored = 1
+            self.max_depth_reached = len(available_moves)  # The table covers the rest of the game
+        else:
+            # Run the chosen algorithm
+            best_move, eval_score, move_reasoning = self._run_algorithm(
+                bb, algorithm, search_depth
+            )
         
         # Handle algorithm failure
         if best_move is None:
@@ -343,7 +551,28 @@ class AIAlgorithms:
         
         # Create final analysis
         analysis = self._create_analysis(move_reasoning, eval_score)
-        return final_move, analysis
+        return index_to_move(final_move), analysis
+    
+    def _opening_book_move(self, bb: Board) -> Optional[int]:
+        """
+        Opening book for a board with at most one piece on it.
+        Take the center, or a corner if the opponent took the center;
+        both keep the game a draw. Returns None later in the game.
+        """
+        occupied = bb[0] | bb[1]
+        if popcount(occupied) > 1:
+            return None
+        if not occupied & (1 << CENTER):
+            return CENTER
+        return CORNERS[0]  # Top-left
+    
+    def _lookup_perfect_play(self, bb: Board) -> Optional[Tuple[int, float]]:
+        """Look up the best move and score of a position in the perfect-play table."""
+        if AIAlgorithms._perfect_play is None:
+            AIAlgorithms._perfect_play = _build_perfect_play_table()
+        
+        x_bits, o_bits, to_move = bb
+        return AIAlgorithms._perfect_play.get(to_move << 18 | x_bits << 9 | o_bits)
     
     def _get_search_depth(self, difficulty: str, max_depth: Optional[int]) -> int:
         """Determine how deep to search based on difficulty."""
@@ -352,40 +581,42 @@ class AIAlgorithms:
         
         depth_settings = {
             "easy": 3,    # Look ahead 3 moves
-            "medium": 6,  # Look ahead 6 moves  
+            "medium": 6,  # Look ahead 6 moves
             "hard": 9     # Search to end of game
         }
         return depth_settings.get(difficulty, 6)
     
-    def _run_algorithm(self, board: list, algorithm: str, search_depth: int) -> Tuple[Optional[Move], float, str]:
+    def _run_algorithm(self, bb: Board, algorithm: str, search_depth: int) -> Tuple[Optional[int], float, str]:
         """Run the specified algorithm and return results."""
         if algorithm == "alpha_beta":
-            result = self.alpha_beta(board, 0, float('-inf'), float('inf'), True, search_depth)
+            stats = self._new_search_stats()
+            result = self.negamax(bb[0], bb[1], 0, -self.INFINITY, self.INFINITY, 1, search_depth, stats)
+            self._record_search_stats(stats)
             best_move = result[0]
             eval_score = result[1]
             reasoning = f"Alpha-beta pruning found best move (pruned {self.pruned_branches} branches)"
-            
+        
         elif algorithm == "depth_limited":
-            result = self.depth_limited_minimax(board, search_depth)
+            result = self._minimax_bb(bb, 0, 1, search_depth)
             best_move = result[0]
             eval_score = result[1]
             reasoning = f"Depth-limited search to depth {search_depth}"
-            
+        
         else:  # minimax
-            result = self.minimax(board, 0, True, search_depth)
+            result = self._minimax_bb(bb, 0, 1, search_depth)
             best_move = result[0]
             eval_score = result[1]
             reasoning = "Classic minimax algorithm"
         
         return best_move, eval_score, reasoning
     
-    def _apply_difficulty_adjustments(self, best_move: Move, available_moves: list, 
-                                    difficulty: str, move_reasoning: str) -> Move:
+    def _apply_difficulty_adjustments(self, best_move: int, available_moves: list,
+                                    difficulty: str, move_reasoning: str) -> int:
         """Apply difficulty-based adjustments to the chosen move."""
         if difficulty == "easy" and len(available_moves) > 1:
             # 30% chance of making a random move instead of optimal move
-            if random.random() < 0.3:
-                random_move = random.choice(available_moves)
+            if self._rng.random() < 0.3:
+                random_move = self._rng.choice(available_moves)
                 move_reasoning = "Random move for easy difficulty"
                 return random_move
         
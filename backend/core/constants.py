@@ -0,0 +1,29 @@
+"""
+Board geometry shared by the game engine and the AI.
+
+Cells are numbered row * 3 + col, which is also their bit in a bitboard mask.
+"""
+from typing import Tuple
+
+FULL_BOARD = 0x1FF
+
+CENTER = 4
+CORNERS = (0, 2, 6, 8)
+EDGES = (1, 3, 5, 7)
+
+WIN_LINES: Tuple[Tuple[int, int, int], ...] = (
+    # Rows
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 7, 8),
+    # Columns
+    (0, 3, 6),
+    (1, 4, 7),
+    (2, 5, 8),
+    # Diagonals
+    (0, 4, 8),
+    (2, 4, 6),
+)
+
+# WIN_LINES as bitboard masks
+WIN_MASKS = tuple(sum(1 << cell for cell in line) for line in WIN_LINES)
\ No newline at end of file
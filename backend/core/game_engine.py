@@ -1,48 +1,172 @@
 from typing import List, Optional, Tuple
 from models import GameState, Move, Player
+from core import search_kernel
+from core.constants import FULL_BOARD
+
+# Bitboard position: (x_bits, o_bits, to_move).
+# Cell (row, col) is stored in bit row * 3 + col of the owning player's mask.
+Board = Tuple[int, int, int]
+
+X_TO_MOVE = 0
+O_TO_MOVE = 1
+
+# The engine checks positions through the search kernel's terminal check, uncompiled
+_terminal_status = search_kernel.python_function(search_kernel.terminal_status_bits)
+_TERMINAL_RESULTS = {
+    search_kernel.ONGOING: None,
+    search_kernel.X_WINS: "X",
+    search_kernel.O_WINS: "O",
+    search_kernel.DRAW: "draw",
+}
+
+
+def _build_symmetries() -> Tuple[Tuple[int, ...], ...]:
+    """
+    Build the 8 symmetries of the board (4 rotations, each optionally mirrored).
+    Each symmetry maps a cell index to the index it moves to.
+    """
+    symmetries = []
+    for mirrored in (False, True):
+        for turns in range(4):
+            permutation = []
+            for index in range(9):
+                row, col = divmod(index, 3)
+                if mirrored:
+                    col = 2 - col
+                for _ in range(turns):
+                    row, col = col, 2 - row  # Rotate 90 degrees clockwise
+                permutation.append(row * 3 + col)
+            symmetries.append(tuple(permutation))
+    return tuple(symmetries)
+
+
+SYMMETRIES = _build_symmetries()
+SYMMETRY_INVERSES = tuple(
+    tuple(permutation.index(index) for index in range(9)) for permutation in SYMMETRIES
+)
+
+
+def transform_bits(bits: int, permutation: Tuple[int, ...]) -> int:
+    """Apply a cell permutation (one of SYMMETRIES) to a bitboard mask."""
+    result = 0
+    for index in range(9):
+        if bits >> index & 1:
+            result |= 1 << permutation[index]
+    return result
+
+
+# SYMMETRY_TABLES[symmetry][bits] is transform_bits(bits, SYMMETRIES[symmetry]) for every mask
+SYMMETRY_TABLES = tuple(
+    tuple(transform_bits(bits, permutation) for bits in range(FULL_BOARD + 1))
+    for permutation in SYMMETRIES
+)
+
+
+def canonical(bb: Board) -> Tuple[int, int]:
+    """
+    Reduce a position to the smallest of its 8 symmetric variants.
+    
+    Returns the canonical position packed into one int, to_move << 18 |
+    x_bits << 9 | o_bits, which is cheaper to hash and compare than a tuple,
+    and the index of the symmetry that produced it.
+    """
+    x_bits, o_bits, to_move = bb
+    best = -1
+    best_symmetry = 0
+    for symmetry, table in enumerate(SYMMETRY_TABLES):
+        candidate = table[x_bits] << 9 | table[o_bits]
+        if best < 0 or candidate < best:
+            best = candidate
+            best_symmetry = symmetry
+    return to_move << 18 | best, best_symmetry
+
+
+def popcount(bits: int) -> int:
+    """Count the occupied cells in a bitboard mask."""
+    return bin(bits).count("1")
+
+
+def move_to_index(move: Move) -> int:
+    """Convert a Move to its cell index (row * 3 + col)."""
+    return move.row * 3 + move.col
+
+
+def index_to_move(index: int) -> Move:
+    """Convert a cell index back to a Move."""
+    return Move(row=index // 3, col=index % 3)
+
+
+def to_bitboard(board: List[List[str]], to_move: Optional[int] = None) -> Board:
+    """
+    Convert a 3x3 list board into a bitboard position.
+    If to_move is not given, it is inferred from the move counts.
+    """
+    x_bits = 0
+    o_bits = 0
+    bit = 1
+    for row in board:
+        for cell in row:
+            if cell == "X":
+                x_bits |= bit
+            elif cell == "O":
+                o_bits |= bit
+            bit <<= 1
+    
+    if to_move is None:
+        to_move = O_TO_MOVE if popcount(x_bits) > popcount(o_bits) else X_TO_MOVE
+    return x_bits, o_bits, to_move
+
 
 class GameEngine:
     """
     Core game engine for tic-tac-toe logic and state management.
-    """
     
-    def __init__(self):
-        self.winning_combinations = [
-            # Rows
-            [(0, 0), (0, 1), (0, 2)],
-            [(1, 0), (1, 1), (1, 2)],
-            [(2, 0), (2, 1), (2, 2)],
-            # Columns
-            [(0, 0), (1, 0), (2, 0)],
-            [(0, 1), (1, 1), (2, 1)],
-            [(0, 2), (1, 2), (2, 2)],
-            # Diagonals
-            [(0, 0), (1, 1), (2, 2)],
-            [(0, 2), (1, 1), (2, 0)]
-        ]
+    The public methods accept the 3x3 list board used by the API; the `_bb`
+    variants work directly on bitboard positions for the AI search.
+    """
     
     def is_valid_board(self, board: List[List[str]]) -> bool:
         """
         Validate if the board state is valid.
         """
+        return self.parse_board_bb(board) is not None
+    
+    def parse_board_bb(self, board: List[List[str]], to_move: Optional[int] = None) -> Optional[Board]:
+        """
+        Validate a 3x3 list board and convert it into a bitboard position in one pass.
+        Returns None if the board is invalid. If to_move is not given, it is
+        inferred from the move counts, as in to_bitboard.
+        """
         if len(board) != 3:
-            return False
+            return None
         
+        # One pass: check the shape and cells while building the masks and counting the moves
+        x_bits = 0
+        o_bits = 0
+        x_count = 0
+        o_count = 0
+        bit = 1
         for row in board:
             if len(row) != 3:
-                return False
+                return None
             for cell in row:
-                if cell not in ["X", "O", ""]:
-                    return False
+                if cell == "X":
+                    x_bits |= bit
+                    x_count += 1
+                elif cell == "O":
+                    o_bits |= bit
+                    o_count += 1
+                elif cell != "":
+                    return None
+                bit <<= 1
         
         # Check if move counts are valid (X should have at most one more move than O)
-        x_count = sum(row.count("X") for row in board)
-        o_count = sum(row.count("O") for row in board)
+        if not o_count <= x_count <= o_count + 1:
+            return None
         
-        if x_count < o_count or x_count > o_count + 1:
-            return False
-        
-        return True
+        if to_move is None:
+            to_move = O_TO_MOVE if x_count > o_count else X_TO_MOVE
+        return x_bits, o_bits, to_move
     
     def is_valid_move(self, board: List[List[str]], row: int, col: int) -> bool:
         """
@@ -60,63 +184,99 @@ class GameEngine:
         new_board[move.row][move.col] = player
         return new_board
     
+    def make_move_bb(self, bb: Board, index: int) -> Board:
+        """
+        Play the side to move on cell index (row * 3 + col) and return the new position.
+        """
+        x_bits, o_bits, to_move = bb
+        bit = 1 << index
+        if to_move == X_TO_MOVE:
+            return x_bits | bit, o_bits, O_TO_MOVE
+        return x_bits, o_bits | bit, X_TO_MOVE
+    
     def check_winner(self, board: List[List[str]]) -> Optional[str]:
         """
         Check if there's a winner on the board.
         Returns 'X', 'O', or None.
         """
-        for combination in self.winning_combinations:
-            cells = [board[row][col] for row, col in combination]
-            if cells[0] != "" and all(cell == cells[0] for cell in cells):
-                return cells[0]
-        return None
+        return self.check_winner_bb(to_bitboard(board))
+    
+    def check_winner_bb(self, bb: Board) -> Optional[str]:
+        """
+        Check a bitboard position for a completed line.
+        Returns 'X', 'O', or None.
+        """
+        status = self.terminal_status_bb(bb)
+        return None if status == "draw" else status
+    
+    def terminal_status_bb(self, bb: Board) -> Optional[str]:
+        """
+        Check a bitboard position for the end of the game.
+        Returns 'X' or 'O' for a winner, 'draw' for a full board, or None.
+        """
+        return _TERMINAL_RESULTS[_terminal_status(bb[0], bb[1])]
     
     def is_draw(self, board: List[List[str]]) -> bool:
         """
         Check if the game is a draw (board full with no winner).
         """
-        if self.check_winner(board) is not None:
-            return False
-        
-        # Check if board is full
-        for row in board:
-            if "" in row:
-                return False
-        return True
+        return self.is_draw_bb(to_bitboard(board))
+    
+    def is_draw_bb(self, bb: Board) -> bool:
+        """
+        Check if a bitboard position is full with no winner.
+        """
+        return self.terminal_status_bb(bb) == "draw"
     
     def is_game_over(self, board: List[List[str]]) -> bool:
         """
         Check if the game is over (winner or draw).
         """
-        return self.check_winner(board) is not None or self.is_draw(board)
+        return self.is_game_over_bb(to_bitboard(board))
+    
+    def is_game_over_bb(self, bb: Board) -> bool:
+        """
+        Check if a bitboard position is over (winner or draw).
+        """
+        return self.terminal_status_bb(bb) is not None
     
     def get_available_moves(self, board: List[List[str]]) -> List[Move]:
         """
         Get all available moves on the board.
         """
-        moves = []
-        for row in range(3):
-            for col in range(3):
-                if board[row][col] == "":
-                    moves.append(Move(row=row, col=col))
-        return moves
+        return self.get_available_moves_bb(to_bitboard(board))
+    
+    def get_available_moves_bb(self, bb: Board) -> List[Move]:
+        """
+        Get all available moves in a bitboard position, in row-major order.
+        """
+        return [index_to_move(index) for index in self.get_available_move_indices_bb(bb)]
+    
+    def get_available_move_indices_bb(self, bb: Board) -> List[int]:
+        """
+        Get the empty cell indices of a bitboard position, in row-major order.
+        """
+        indices = []
+        empty = ~(bb[0] | bb[1]) & FULL_BOARD
+        while empty:
+            bit = empty & -empty
+            indices.append(bit.bit_length() - 1)
+            empty ^= bit
+        return indices
     
     def get_game_state(self, board: List[List[str]]) -> GameState:
         """
         Create a GameState object from the current board.
         """
-        winner = self.check_winner(board)
-        if winner is None and self.is_draw(board):
-            winner = "draw"
+        bb = to_bitboard(board)
+        winner = self.terminal_status_bb(bb)
         
-        # Count moves to determine current player
-        x_count = sum(row.count("X") for row in board)
-        o_count = sum(row.count("O") for row in board)
-        current_player = Player.O if x_count > o_count else Player.X
+        # The move counts determine the current player
+        current_player = Player.O if bb[2] == O_TO_MOVE else Player.X
         
         return GameState(
             board=board,
             current_player=current_player,
             winner=winner,
-            move_count=x_count + o_count
+            move_count=popcount(bb[0] | bb[1])
         )
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+Integer-only search kernels on bitboards.
+
+The functions here use nothing but ints and tuples of ints, so Numba can
+compile them to machine code when it is installed. Without Numba they run
+as plain Python.
+"""
+try:
+    import numba
+    import numpy as np
+except ImportError:  # Numba is optional
+    numba = None
+    np = None
+
+from core.constants import CENTER, CORNERS, FULL_BOARD, WIN_MASKS
+
+# Evaluation scores, from the AI's (O's) point of view
+WIN_SCORE = 100
+LOSE_SCORE = -100
+DRAW_SCORE = 0
+
+# Results of terminal_status_bits
+ONGOING = 0
+X_WINS = 1
+O_WINS = 2
+DRAW = 3
+
+# Larger than any evaluation score
+INFINITY = 10_000
+
+# Marks a position the minimax transposition table has no score for
+UNKNOWN = INFINITY
+
+# Slots of the search counters (see new_stats)
+STAT_NODES = 0
+STAT_PRUNED = 1
+STAT_MAX_DEPTH = 2
+STAT_WRITTEN = 3
+STATS_SIZE = 4
+
+# More than the 5478 positions one search can reach
+MAX_TABLE_ENTRIES = 1 << 13
+
+CENTER_MASK = 1 << CENTER
+CORNER_MASK = sum(1 << cell for cell in CORNERS)
+
+
+def jit(function):
+    """Compile a kernel with Numba when it is available."""
+    if numba is None:
+        return function
+    return numba.njit(cache=True)(function)
+
+
+def new_stats():
+    """
+    Create the counters a kernel search updates:
+    [nodes explored, pruned branches, max depth reached, table entries written].
+    
+    Minimax never prunes, so its pruned slot stays 0; the layout is shared with
+    the alpha-beta search so that both are recorded the same way.
+    """
+    if np is None:
+        return [0] * STATS_SIZE
+    return np.zeros(STATS_SIZE, dtype=np.int64)
+
+
+def new_table():
+    """
+    Create the transposition table of one minimax search.
+    
+    It holds the score of each searched position, indexed by (x_bits << 9) | o_bits.
+    Within a search a position is always the same number of plies from the root,
+    with the same side to move, so its score is exact whenever it recurs.
+    
+    The table can be reused by a later search once clear_table has reset the
+    entries the previous search wrote.
+    """
+    if np is None:
+        return [UNKNOWN] * (1 << 18)
+    return np.full(1 << 18, UNKNOWN, dtype=np.int64)
+
+
+def new_written_keys():
+    """Create the list of table keys a minimax search writes (see clear_table)."""
+    if np is None:
+        return [0] * MAX_TABLE_ENTRIES
+    return np.zeros(MAX_TABLE_ENTRIES, dtype=np.int64)
+
+
+def python_function(kernel):
+    """
+    Return the plain Python version of a kernel.
+    
+    Calling a compiled kernel from the interpreter goes through Numba's
+    dispatcher, which costs more than the small per-node kernels themselves.
+    """
+    return getattr(kernel, "py_func", kernel)
+
+
+@jit
+def terminal_status_bits(x_bits, o_bits):
+    """
+    Check for the end of the game with a WIN_TABLE lookup per player.
+    Returns X_WINS, O_WINS, DRAW or ONGOING.
+    """
+    if WIN_TABLE[x_bits]:
+        return X_WINS
+    if WIN_TABLE[o_bits]:
+        return O_WINS
+    if (x_bits | o_bits) == FULL_BOARD:
+        return DRAW
+    return ONGOING
+
+
+@jit
+def terminal_score_bits(status, depth):
+    """Score a finished game from the AI's point of view."""
+    if status == X_WINS:
+        return LOSE_SCORE + depth  # Delay losses if unavoidable
+    if status == O_WINS:
+        return WIN_SCORE - depth  # Prefer quicker wins
+    return DRAW_SCORE
+
+
+def _build_win_table():
+    """Check every possible player mask for a completed line once, at import."""
+    return tuple(
+        any((bits & mask) == mask for mask in WIN_MASKS) for bits in range(FULL_BOARD + 1)
+    )
+
+
+# WIN_TABLE[bits] is True when a player's mask contains a completed line
+WIN_TABLE = _build_win_table()
+
+
+def _build_mask_values():
+    """
+    Positional value of each possible set of one player's cells.
+    Index the result with a player's bitboard mask.
+    """
+    return tuple(
+        3 * bin(bits & CENTER_MASK).count("1") + 2 * bin(bits & CORNER_MASK).count("1")
+        for bits in range(FULL_BOARD + 1)
+    )
+
+
+MASK_VALUES = _build_mask_values()
+
+
+@jit
+def position_value_bits(x_bits, o_bits):
+    """
+    Calculate positional value for non-terminal positions.
+    
+    Strategy:
+    - Center control is valuable (3 points)
+    - Corner control is good (2 points each)
+    - Edge positions are neutral
+    
+    Each side's value is one MASK_VALUES lookup, so there is no per-cell branching.
+    """
+    return MASK_VALUES[o_bits] - MASK_VALUES[x_bits]
+
+
+@jit
+def clear_table(table, written, count):
+    """Reset the first count entries listed in written back to UNKNOWN."""
+    for i in range(count):
+        table[written[i]] = UNKNOWN
+
+
+@jit
+def minimax_search(x_bits, o_bits, color, depth, max_depth, stats, table, written):
+    """
+    Minimax in negamax form.
+    
+    color is +1 when O (the AI) moves and -1 when X moves. Scores are from the
+    point of view of the side to move. Returns (best cell index, score), with
+    index -1 at terminal and depth-limit nodes.
+    
+    Children already scored in table (see new_table) are not searched again.
+    The key of every entry written to table is appended to written, with
+    stats[STAT_WRITTEN] counting them.
+    """
+    # Update search statistics
+    stats[STAT_NODES] += 1
+    if depth > stats[STAT_MAX_DEPTH]:
+        stats[STAT_MAX_DEPTH] = depth
+    
+    # Base case: game over or reached maximum search depth
+    status = terminal_status_bits(x_bits, o_bits)
+    if status != ONGOING:
+        return -1, color * terminal_score_bits(status, depth)
+    if depth >= max_depth:
+        return -1, color * position_value_bits(x_bits, o_bits)
+    
+    best_index = -1
+    best_score = -INFINITY
+    occupied = x_bits | o_bits
+    
+    for index in range(9):
+        bit = 1 << index
+        if occupied & bit:
+            continue
+        
+        # See what happens if the opponent plays optimally after this move
+        if color == 1:
+            child_x, child_o = x_bits, o_bits | bit
+        else:
+            child_x, child_o = x_bits | bit, o_bits
+        key = (child_x << 9) | child_o
+        child_score = table[key]
+        if child_score == UNKNOWN:
+            child_score = minimax_search(child_x, child_o, -color, depth + 1, max_depth, stats, table, written)[1]
+            table[key] = child_score
+            written[stats[STAT_WRITTEN]] = key
+            stats[STAT_WRITTEN] += 1
+        score = -child_score
+        
+        # Keep track of the best move so far
+        if score > best_score:
+            best_score = score
+            best_index = index
+    
+    return best_index, best_score
\ No newline at end of file
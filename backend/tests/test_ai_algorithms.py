@@ -59,6 +59,42 @@ class TestAIAlgorithms:
         # Should get same evaluation (moves might differ if multiple optimal moves exist)
         assert abs(minimax_score - ab_score) < 0.1
     
+    def test_alpha_beta_transposition_table(self):
+        """Test alpha-beta with the transposition table still matches minimax."""
+        board = [["X", "", ""], ["", "", ""], ["", "", "O"]]
+        
+        minimax_move, minimax_score = self.ai.minimax(board, 0, True, 9)
+        
+        self.ai._reset_stats()
+        ab_move, ab_score = self.ai.alpha_beta(board, 0, float('-inf'), float('inf'), True, 9)
+        
+        assert ab_score == minimax_score
+        assert len(self.ai.tt) > 0
+    
+    def test_minimax_transposition_table(self):
+        """Test minimax searches each reachable position only once."""
+        board = [["", "", ""], ["", "", ""], ["", "", ""]]
+        
+        self.ai._reset_stats()
+        move, score = self.ai.minimax(board, 0, True, 9)
+        
+        assert score == 0  # Perfect play is a draw
+        assert self.ai.nodes_explored == 5478  # Reachable tic-tac-toe positions
+    
+    def test_minimax_repeated_search_same_stats(self):
+        """Test a repeated minimax search explores the same nodes as the first one."""
+        board = [["X", "", "X"], ["", "O", ""], ["", "", ""]]
+        
+        self.ai._reset_stats()
+        first_result = self.ai.minimax(board, 0, True, 3)
+        first_stats = (self.ai.nodes_explored, self.ai.max_depth_reached)
+        
+        self.ai._reset_stats()
+        result = self.ai.minimax(board, 0, True, 3)
+        
+        assert result == first_result
+        assert (self.ai.nodes_explored, self.ai.max_depth_reached) == first_stats
+    
     def test_alpha_beta_pruning(self):
         """Test alpha-beta pruning reduces node exploration."""
         board = [["", "", ""], ["", "", ""], ["", "", ""]]
@@ -102,13 +138,15 @@ class TestAIAlgorithms:
     
     def test_get_best_move_alpha_beta(self):
         """Test get_best_move with alpha-beta algorithm."""
+        # Medium searches 6 plies, fewer than the 7 empty cells, so the position is really searched
         board = [["X", "", ""], ["", "O", ""], ["", "", ""]]
         
-        move, analysis = self.ai.get_best_move(board, "alpha_beta", "hard")
+        move, analysis = self.ai.get_best_move(board, "alpha_beta", "medium")
         
         assert isinstance(move, Move)
+        assert analysis.nodes_explored > 1
         assert analysis.pruned_branches >= 0
-        assert "alpha-beta" in analysis.move_reasoning.lower()
+        assert "Alpha-beta pruning found best move" in analysis.move_reasoning
     
     def test_get_best_move_depth_limited(self):
         """Test get_best_move with depth-limited algorithm."""
@@ -120,18 +158,44 @@ class TestAIAlgorithms:
         assert analysis.max_depth_reached <= 3  # Easy difficulty
         assert "depth" in analysis.move_reasoning.lower()
     
+    def test_get_best_move_perfect_play_table(self):
+        """Test full-depth searches are answered from the perfect-play table."""
+        board = [["O", "O", ""], ["X", "X", ""], ["X", "", ""]]
+        
+        move, analysis = self.ai.get_best_move(board, "alpha_beta", "hard")
+        
+        assert move.row == 0 and move.col == 2  # Winning move
+        assert analysis.evaluation_score > 90
+        assert "perfect-play table" in analysis.move_reasoning
+    
+    def test_get_best_move_opening_book(self):
+        """Test the first move of each side comes from the opening book."""
+        empty_board = [["", "", ""], ["", "", ""], ["", "", ""]]
+        move, analysis = self.ai.get_best_move(empty_board, "alpha_beta", "medium")
+        assert move.row == 1 and move.col == 1  # Center
+        assert "opening book" in analysis.move_reasoning.lower()
+        
+        center_taken = [["", "", ""], ["", "X", ""], ["", "", ""]]
+        move, analysis = self.ai.get_best_move(center_taken, "minimax", "hard")
+        assert move.row == 0 and move.col == 0  # Corner
+        assert analysis.evaluation_score == 0
+    
     def test_difficulty_levels(self):
         """Test different difficulty levels affect search depth."""
-        board = [["", "", ""], ["", "", ""], ["", "", ""]]
+        # Past the opening book, with more empty cells than medium searches,
+        # so neither difficulty is answered from a table
+        board = [["X", "", ""], ["", "O", ""], ["", "", ""]]
         
         # Easy difficulty
         move_easy, analysis_easy = self.ai.get_best_move(board, "minimax", "easy")
         
-        # Hard difficulty  
-        move_hard, analysis_hard = self.ai.get_best_move(board, "minimax", "hard")
+        # Medium difficulty
+        move_medium, analysis_medium = self.ai.get_best_move(board, "minimax", "medium")
         
-        # Hard should explore more nodes (deeper search)
-        assert analysis_hard.max_depth_reached >= analysis_easy.max_depth_reached
+        # Medium should search deeper and explore more nodes
+        assert analysis_easy.max_depth_reached == 3
+        assert analysis_medium.max_depth_reached == 6
+        assert analysis_medium.nodes_explored > analysis_easy.nodes_explored
     
     def test_no_moves_available(self):
         """Test error when no moves are available."""
@@ -1,5 +1,7 @@
 import pytest
-from core.game_engine import GameEngine
+from core.constants import WIN_LINES
+from core.game_engine import GameEngine, SYMMETRIES, canonical, to_bitboard, transform_bits
+from core.search_kernel import WIN_TABLE
 from models import Move
 
 class TestGameEngine:
@@ -28,6 +30,13 @@ class TestGameEngine:
         board = [["O", "O", ""], ["", "", ""], ["", "", ""]]
         assert self.engine.is_valid_board(board) == False
     
+    def test_parse_board_bb(self):
+        """Test validating and converting a board in one pass."""
+        board = [["X", "", ""], ["", "O", ""], ["", "", "X"]]
+        assert self.engine.parse_board_bb(board) == to_bitboard(board)
+        assert self.engine.parse_board_bb([["X", "X", ""], ["", "", ""], ["", "", ""]]) is None
+        assert self.engine.parse_board_bb([["X", "", ""], ["", ""]]) is None
+    
     def test_is_valid_move(self):
         """Test move validation."""
         board = [["X", "", ""], ["", "", ""], ["", "", ""]]
@@ -64,6 +73,16 @@ class TestGameEngine:
         board = [["X", "O", ""], ["", "", ""], ["", "", ""]]
         assert self.engine.check_winner(board) == None
     
+    def test_win_table(self):
+        """Test the win lookup table against the winning lines, cell by cell, for every mask."""
+        for bits in range(512):
+            expected = any(all(bits >> cell & 1 for cell in line) for line in WIN_LINES)
+            assert WIN_TABLE[bits] == expected
+        
+        x_bits, o_bits, _ = to_bitboard([["X", "O", "X"], ["O", "X", "O"], ["O", "", "X"]])
+        assert WIN_TABLE[x_bits]  # Diagonal
+        assert not WIN_TABLE[o_bits]
+    
     def test_is_draw(self):
         """Test draw detection."""
         board = [["X", "O", "X"], ["O", "X", "O"], ["O", "X", "O"]]
@@ -74,6 +93,15 @@ class TestGameEngine:
         board = [["X", "X", "X"], ["O", "O", ""], ["", "", ""]]
         assert self.engine.is_draw(board) == False
     
+    def test_canonical_symmetric_positions(self):
+        """Test all 8 symmetric variants of a position share one canonical key."""
+        x_bits, o_bits, to_move = to_bitboard([["X", "O", ""], ["", "X", ""], ["", "", "O"]])
+        key, _ = canonical((x_bits, o_bits, to_move))
+        
+        for permutation in SYMMETRIES:
+            variant = (transform_bits(x_bits, permutation), transform_bits(o_bits, permutation), to_move)
+            assert canonical(variant)[0] == key
+    
     def test_get_available_moves(self):
         """Test getting available moves."""
         board = [["X", "", ""], ["", "O", ""], ["", "", ""]]